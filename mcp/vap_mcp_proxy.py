@@ -31,6 +31,10 @@ Usage:
 
 Configuration:
     Set VAP_API_KEY environment variable (VAPE_API_KEY also supported for backward compatibility).
+    Completed/failed tasks are cached in ~/.cache/vap-mcp/tasks.sqlite
+    (override with VAP_TASK_CACHE_PATH, or set it to "" to disable).
+    Entries are scoped to VAP_API_BASE_URL and a hash of VAP_API_KEY, so a
+    different environment or account never sees another's cached tasks.
 
 Claude Desktop config (~/.config/Claude/claude_desktop_config.json):
 {
@@ -57,10 +61,19 @@ Directive: #549 (HTTP Mode for Glama)
 import sys
 import json
 import os
+import atexit
+import functools
+import time
 import logging
+import sqlite3
+import hashlib
+import re
 import argparse
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from typing import Optional, Dict, Any
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Optional, Dict, Any, Tuple
 
 # Use httpx for async HTTP (pip install httpx)
 try:
@@ -69,6 +82,25 @@ except ImportError:
     # Fallback to requests if httpx not available
     import requests as httpx
 
+# orjson parses/serializes straight from/to bytes (pip install orjson)
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode('utf-8')
+
+# HTTP/2 multiplexes concurrent calls over one connection (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 # ═══════════════════════════════════════════════════════════════════════════
 # CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════════════
@@ -78,6 +110,24 @@ API_BASE_URL = os.getenv("VAP_API_BASE_URL", os.getenv("VAPE_API_BASE_URL", "htt
 # Support both VAP_API_KEY (new) and VAPE_API_KEY (legacy) for backward compatibility
 API_KEY = os.getenv("VAP_API_KEY", os.getenv("VAPE_API_KEY", "")).strip()
 
+# Concurrent in-flight requests in stdio mode
+STDIO_WORKERS = int(os.getenv("VAP_STDIO_WORKERS", "8"))
+
+# Ceiling on concurrent upstream calls (MCP and V3 APIs alike), and retries
+# when the V3 API is overloaded. V3 POSTs create billed tasks and are not
+# idempotent, so only 429 is retried: a rate-limited request was rejected
+# before any work was done, while a 5xx (even 503 from a gateway) may
+# arrive after the task was created.
+UPSTREAM_CONCURRENCY = int(os.getenv("VAP_UPSTREAM_CONCURRENCY", "16"))
+UPSTREAM_MAX_ATTEMPTS = 3
+RETRY_STATUS_CODES = (429,)
+
+# On-disk cache of completed/failed tasks, so a restarted proxy doesn't
+# re-poll tasks whose results are already known. Set to "" to disable.
+TASK_CACHE_PATH = os.getenv("VAP_TASK_CACHE_PATH", os.path.join(
+    os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "vap-mcp", "tasks.sqlite"
+))
+
 # Video pricing (Directive #242: Veo 3.1)
 # COGS: $0.40/sec with audio, $0.20/sec without
 # Sell price: 50% margin on COGS
@@ -93,61 +143,120 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class _LazyJSON:
+    """Log argument that only serializes when the record is actually emitted."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return json.dumps(self.obj)
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # HTTP CLIENT
 # ═══════════════════════════════════════════════════════════════════════════
 
+# API_KEY is fixed at startup, so the request headers are built once
+_HEADERS = {
+    "Content-Type": "application/json",
+}
+if API_KEY:
+    _HEADERS["Authorization"] = f"Bearer {API_KEY}"
+
+
+# Pooled clients, created once at import so every JSON-RPC call reuses
+# keep-alive connections instead of paying a fresh TCP+TLS handshake.
+HTTP_LIMITS = {"max_keepalive_connections": 20, "max_connections": 100}
+
+if hasattr(httpx, 'Client'):
+    # httpx
+    _MCP_CLIENT = httpx.Client(
+        base_url=API_URL,
+        timeout=60.0,
+        headers=_HEADERS,
+        limits=httpx.Limits(**HTTP_LIMITS),
+        http2=HTTP2_AVAILABLE,
+    )
+    _V3_CLIENT = httpx.Client(
+        base_url=API_BASE_URL,
+        headers=_HEADERS,
+        limits=httpx.Limits(**HTTP_LIMITS),
+        http2=HTTP2_AVAILABLE,
+    )
+    atexit.register(_MCP_CLIENT.close)
+    atexit.register(_V3_CLIENT.close)
+
+    _mcp_post = _MCP_CLIENT.post
+    _v3_post = functools.partial(_V3_CLIENT.post, timeout=120.0)
+    _v3_get = functools.partial(_V3_CLIENT.get, timeout=30.0)
+else:
+    # requests fallback
+    _MCP_CLIENT = _V3_CLIENT = None
+
+    def _mcp_post(endpoint: str, json: Dict):
+        return httpx.post(f"{API_URL}{endpoint}", json=json, headers=_HEADERS, timeout=60)
+
+    def _v3_post(endpoint: str, json: Dict):
+        return httpx.post(f"{API_BASE_URL}{endpoint}", json=json, headers=_HEADERS, timeout=120)
+
+    def _v3_get(endpoint: str):
+        return httpx.get(f"{API_BASE_URL}{endpoint}", headers=_HEADERS, timeout=30)
+
+
+# Caps in-flight upstream calls across all worker threads
+_upstream_slots = threading.BoundedSemaphore(UPSTREAM_CONCURRENCY)
+
+
 def make_request(endpoint: str, payload: Optional[Dict] = None) -> Dict[str, Any]:
     """Make HTTP request to VAP MCP API."""
-    url = f"{API_URL}{endpoint}"
-    headers = {
-        "Content-Type": "application/json",
-    }
-    if API_KEY:
-        headers["Authorization"] = f"Bearer {API_KEY}"
-
-    logger.debug(f"Request: POST {url}")
-    logger.debug(f"Payload: {json.dumps(payload)}")
+    logger.debug(f"Request: POST {API_URL}{endpoint}")
+    logger.debug("Payload: %s", _LazyJSON(payload))
 
     try:
-        if hasattr(httpx, 'Client'):
-            # httpx
-            with httpx.Client(timeout=60.0) as client:
-                response = client.post(url, json=payload or {}, headers=headers)
-                response.raise_for_status()
-                return response.json()
-        else:
-            # requests fallback
-            response = httpx.post(url, json=payload or {}, headers=headers, timeout=60)
-            response.raise_for_status()
-            return response.json()
+        with _upstream_slots:
+            response = _mcp_post(endpoint, json=payload or {})
+        logger.debug("Response: %s %s", response.status_code, getattr(response, "http_version", ""))
+        response.raise_for_status()
+        return response.json()
     except Exception as e:
         logger.error(f"HTTP error: {e}")
         return {"error": str(e)}
 
 
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Seconds to wait before retrying; honors a Retry-After header if present."""
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), 60.0)
+        except ValueError:
+            pass
+    return min(0.2 * 2 ** attempt, 10.0)
+
+
 def make_v3_request(endpoint: str, payload: Optional[Dict] = None) -> Dict[str, Any]:
     """Make HTTP request to VAP V3 API (Directive #240)."""
-    url = f"{API_BASE_URL}{endpoint}"
-    headers = {
-        "Content-Type": "application/json",
-    }
-    if API_KEY:
-        headers["Authorization"] = f"Bearer {API_KEY}"
-
-    logger.debug(f"V3 Request: POST {url}")
-    logger.debug(f"Payload: {json.dumps(payload)}")
+    logger.debug(f"V3 Request: POST {API_BASE_URL}{endpoint}")
+    logger.debug("Payload: %s", _LazyJSON(payload))
 
     try:
-        if hasattr(httpx, 'Client'):
-            with httpx.Client(timeout=120.0) as client:
-                response = client.post(url, json=payload or {}, headers=headers)
-                response.raise_for_status()
-                return response.json()
-        else:
-            response = httpx.post(url, json=payload or {}, headers=headers, timeout=120)
-            response.raise_for_status()
-            return response.json()
+        for attempt in range(UPSTREAM_MAX_ATTEMPTS):
+            with _upstream_slots:
+                response = _v3_post(endpoint, json=payload or {})
+            logger.debug("V3 Response: %s %s", response.status_code, getattr(response, "http_version", ""))
+
+            if response.status_code not in RETRY_STATUS_CODES or attempt == UPSTREAM_MAX_ATTEMPTS - 1:
+                break
+
+            # Rate limited: back off (outside the semaphore) and try again
+            delay = _retry_delay(attempt, response.headers.get("Retry-After"))
+            logger.warning(f"V3 API returned {response.status_code}, retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+        response.raise_for_status()
+        return response.json()
     except Exception as e:
         # D#509: Extract detailed error from response body
         error_detail = str(e)
@@ -182,10 +291,103 @@ def handle_initialize(params: Dict) -> Dict:
     return response
 
 
+# The tool schema is effectively static. A snapshot of the upstream
+# tools/list result ships with the proxy (tools_list.json) and is what the
+# first tools/list of every session returns. It is only used when its
+# version matches the package version (mcp/__init__.py); otherwise the
+# first call goes upstream. Regenerate it with --dump-tools-list. The
+# upstream copy is re-fetched in the background once it is older than
+# TOOLS_LIST_TTL.
+_PROXY_DIR = os.path.dirname(os.path.abspath(__file__))
+TOOLS_LIST_FILE = os.path.join(_PROXY_DIR, "tools_list.json")
+TOOLS_LIST_TTL = 300.0
+
+
+def _package_version() -> Optional[str]:
+    """Read __version__ from the package __init__.py next to the proxy."""
+    try:
+        with open(os.path.join(_PROXY_DIR, "__init__.py"), encoding="utf-8") as f:
+            match = re.search(r"^__version__\s*=\s*['\"]([^'\"]+)['\"]", f.read(), re.M)
+    except OSError:
+        return None
+    return match.group(1) if match else None
+
+
+def _load_bundled_tools_list() -> Optional[Dict]:
+    """Load the tools/list result shipped alongside the proxy, if current."""
+    try:
+        with open(TOOLS_LIST_FILE, "rb") as f:
+            snapshot = _json_loads(f.read())
+        tools = snapshot["tools"]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Bundled tool schema unavailable ({TOOLS_LIST_FILE}): {e}")
+        return None
+
+    version = _package_version()
+    if version is None or snapshot.get("version") != version:
+        logger.warning(
+            f"Bundled tool schema is for version {snapshot.get('version')}, not {version}; "
+            "fetching tools/list upstream (regenerate with --dump-tools-list)"
+        )
+        return None
+    return {"tools": tools}
+
+
+_tools_list_cache: Optional[Dict] = _load_bundled_tools_list()
+_tools_list_fetched_at: Optional[float] = None  # None until fetched upstream
+_tools_list_refreshing = threading.Lock()
+
+
+def _refresh_tools_list() -> Dict:
+    """Fetch tools/list upstream; keep the cached copy if the call fails."""
+    global _tools_list_cache, _tools_list_fetched_at
+
+    response = make_request("/tools/list", {})
+    if "error" not in response:
+        _tools_list_cache = response
+        _tools_list_fetched_at = time.monotonic()
+    return response
+
+
+def _refresh_tools_list_in_background():
+    """Refresh tools/list on a daemon thread (at most one at a time)."""
+    if not _tools_list_refreshing.acquire(blocking=False):
+        return
+
+    def _run():
+        try:
+            _refresh_tools_list()
+        finally:
+            _tools_list_refreshing.release()
+
+    threading.Thread(target=_run, name="vap-tools-refresh", daemon=True).start()
+
+
 def handle_tools_list(params: Dict) -> Dict:
     """Handle tools/list request."""
+    cached = _tools_list_cache
+    if cached is None:
+        return _refresh_tools_list()
+
+    fetched_at = _tools_list_fetched_at
+    if fetched_at is None or time.monotonic() - fetched_at >= TOOLS_LIST_TTL:
+        _refresh_tools_list_in_background()
+    return cached
+
+
+def dump_tools_list(path: str = TOOLS_LIST_FILE) -> int:
+    """Write the current upstream tools/list result to the bundled snapshot."""
     response = make_request("/tools/list", {})
-    return response
+    if "error" in response or "tools" not in response:
+        logger.error(f"Could not fetch tools/list: {response.get('error', response)}")
+        return 1
+
+    version = _package_version()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": version, "tools": response["tools"]}, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    logger.info(f"Wrote {len(response['tools'])} tools (version {version}) to {path}")
+    return 0
 
 
 def handle_tools_call(params: Dict) -> Dict:
@@ -197,18 +399,10 @@ def handle_tools_call(params: Dict) -> Dict:
     tool_name = params.get("name", "")
     arguments = params.get("arguments", {})
 
-    # ═══════════════════════════════════════════════════════════════════
-    # VIDEO TOOL HANDLERS (Directive #240)
-    # ═══════════════════════════════════════════════════════════════════
-
-    if tool_name == "generate_video":
-        return _handle_generate_video(arguments)
-
-    if tool_name == "estimate_video_cost":
-        return _handle_estimate_video_cost(arguments)
-
-    if tool_name == "get_task":
-        return _handle_get_task(arguments)
+    # Video tool handlers (Directive #240)
+    handler = LOCAL_TOOL_HANDLERS.get(tool_name)
+    if handler is not None:
+        return handler(arguments)
 
     # Default: forward to MCP API
     response = make_request("/tools/call", {
@@ -286,28 +480,157 @@ def _handle_generate_video(arguments: Dict) -> Dict:
     }
 
 
+# Video is sold at a fixed price, so the estimate doesn't depend on
+# duration or audio and can be built once.
+_ESTIMATE_VIDEO_COST_RESPONSE = {
+    "content": [{
+        "type": "text",
+        "text": "Video Generation Cost: $1.96 USD (fixed price)\n\nProvider: Veo 3.1\nRequires: Tier 2+"
+    }]
+}
+
+
 def _handle_estimate_video_cost(arguments: Dict) -> Dict:
     """
     Handle estimate_video_cost tool call (Directive #242: Veo 3.1).
 
     Local calculation - no API call needed.
     """
-    duration = arguments.get("duration", 8)
-    generate_audio = arguments.get("generate_audio", True)
+    return _ESTIMATE_VIDEO_COST_RESPONSE
+
+
+# Clients poll get_task in tight loops. Recent responses are reused for
+# TASK_CACHE_TTL seconds; completed/failed tasks never change, so those are
+# kept until evicted.
+TASK_CACHE_TTL = 1.0
+TASK_CACHE_SIZE = 1024
+TERMINAL_TASK_STATUSES = ("completed", "failed")
+
+_task_cache: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+_task_cache_lock = threading.Lock()
+
+
+def _get_cached_task(task_id: str) -> Optional[Dict]:
+    """Return a cached task response if it is still fresh (or terminal)."""
+    with _task_cache_lock:
+        entry = _task_cache.get(task_id)
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if (response.get("status") in TERMINAL_TASK_STATUSES
+                or time.monotonic() - stored_at < TASK_CACHE_TTL):
+            _task_cache.move_to_end(task_id)
+            return response
+        return None
+
+
+def _store_cached_task(task_id: str, response: Dict):
+    """Cache a task response, evicting the least recently used entries."""
+    with _task_cache_lock:
+        _task_cache[task_id] = (time.monotonic(), response)
+        _task_cache.move_to_end(task_id)
+        while len(_task_cache) > TASK_CACHE_SIZE:
+            _task_cache.popitem(last=False)
+
+
+# Bounded to TASK_DB_MAX_ROWS: pruned when the file is opened (each proxy
+# start) and every TASK_DB_PRUNE_EVERY writes within a run
+TASK_DB_MAX_ROWS = 1000
+TASK_DB_PRUNE_EVERY = 100
+
+_task_db: Optional[sqlite3.Connection] = None
+_task_db_disabled = not TASK_CACHE_PATH
+_task_db_writes = 0
+_task_db_lock = threading.Lock()
+
+# Cached tasks are only visible to the same API environment and account
+# (the key itself is never stored, just a truncated hash)
+_TASK_DB_SCOPE = f"{API_BASE_URL}|{hashlib.sha256(API_KEY.encode('utf-8')).hexdigest()[:16]}"
+
+
+def _prune_task_db(db: sqlite3.Connection):
+    """Keep only the TASK_DB_MAX_ROWS most recently stored tasks."""
+    db.execute(
+        "DELETE FROM task_results WHERE rowid NOT IN "
+        "(SELECT rowid FROM task_results ORDER BY stored_at DESC LIMIT ?)",
+        (TASK_DB_MAX_ROWS,),
+    )
 
-    # Validate duration (Veo 3.1: 4, 6, 8 seconds)
-    if duration not in (4, 6, 8):
-        duration = 8
 
-    cost_table = VIDEO_COSTS_WITH_AUDIO if generate_audio else VIDEO_COSTS_NO_AUDIO
-    cost = cost_table.get(duration, 4.80)
+def _open_task_db() -> Optional[sqlite3.Connection]:
+    """Open the persistent task cache on first use (call with _task_db_lock held)."""
+    global _task_db, _task_db_disabled
 
-    return {
-        "content": [{
-            "type": "text",
-            "text": f"Video Generation Cost: $1.96 USD (fixed price)\n\nProvider: Veo 3.1\nRequires: Tier 2+"
-        }]
-    }
+    if _task_db is None and not _task_db_disabled:
+        try:
+            os.makedirs(os.path.dirname(TASK_CACHE_PATH) or ".", exist_ok=True)
+            db = sqlite3.connect(TASK_CACHE_PATH, isolation_level=None, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS task_results ("
+                "scope TEXT NOT NULL, task_id TEXT NOT NULL, json BLOB NOT NULL, "
+                "stored_at REAL NOT NULL, PRIMARY KEY (scope, task_id))"
+            )
+            # Unscoped table from earlier versions; never read
+            db.execute("DROP TABLE IF EXISTS tasks")
+            _prune_task_db(db)
+            _task_db = db
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Task cache disabled ({TASK_CACHE_PATH}): {e}")
+            _task_db_disabled = True
+    return _task_db
+
+
+def _load_persisted_task(task_id: str) -> Optional[Dict]:
+    """Return a completed/failed task response stored by an earlier run."""
+    with _task_db_lock:
+        db = _open_task_db()
+        if db is None:
+            return None
+        try:
+            row = db.execute(
+                "SELECT json FROM task_results WHERE scope = ? AND task_id = ?",
+                (_TASK_DB_SCOPE, task_id),
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Task cache read failed: {e}")
+            return None
+    return _json_loads(row[0]) if row else None
+
+
+def _persist_task(task_id: str, response: Dict):
+    """Store a completed/failed task response, pruning the oldest rows periodically."""
+    global _task_db_writes
+
+    with _task_db_lock:
+        db = _open_task_db()
+        if db is None:
+            return
+        try:
+            db.execute(
+                "INSERT OR REPLACE INTO task_results (scope, task_id, json, stored_at) "
+                "VALUES (?, ?, ?, ?)",
+                (_TASK_DB_SCOPE, task_id, _json_dumps(response), time.time()),
+            )
+            _task_db_writes += 1
+            if _task_db_writes % TASK_DB_PRUNE_EVERY == 0:
+                _prune_task_db(db)
+        except sqlite3.Error as e:
+            logger.warning(f"Task cache write failed: {e}")
+
+
+_TASK_SUMMARY_TEMPLATE = "Task: {task_id}\nType: {task_type}\nStatus: {status}\nEstimated Cost: ${estimated_cost}"
+
+_TASK_DETAIL_TEMPLATES = {
+    ("completed", "audio"): "\n\n🎵 Audio URL: {url}",
+    ("completed", "video"): "\n\n🎬 Video URL: {url}",
+    ("completed", "image"): "\n\n🖼️ Image URL: {url}",
+    ("failed", "error"): "\n\n❌ Error: {error_message}",
+    ("pending", None): "\n\n⏳ Task is still {status}. Check again shortly.",
+    ("queued", None): "\n\n⏳ Task is still {status}. Check again shortly.",
+    ("executing", None): "\n\n⏳ Task is still {status}. Check again shortly.",
+}
 
 
 def _handle_get_task(arguments: Dict) -> Dict:
@@ -324,14 +647,24 @@ def _handle_get_task(arguments: Dict) -> Dict:
             "content": [{"type": "text", "text": "Error: task_id is required"}]
         }
 
-    # Fetch task from V3 API
-    response = make_v3_get_request(f"/v3/tasks/{task_id}")
+    # Fetch task from V3 API (or the polling / on-disk caches)
+    response = _get_cached_task(task_id)
+    if response is None:
+        response = _load_persisted_task(str(task_id))
 
-    if "error" in response:
-        return {
-            "isError": True,
-            "content": [{"type": "text", "text": f"Error: {response['error']}"}]
-        }
+        if response is None:
+            response = make_v3_get_request(f"/v3/tasks/{task_id}")
+
+            if "error" in response:
+                return {
+                    "isError": True,
+                    "content": [{"type": "text", "text": f"Error: {response['error']}"}]
+                }
+
+            if response.get("status") in TERMINAL_TASK_STATUSES:
+                _persist_task(str(task_id), response)
+
+        _store_cached_task(task_id, response)
 
     # Extract fields
     status = response.get("status", "unknown")
@@ -354,58 +687,54 @@ def _handle_get_task(arguments: Dict) -> Dict:
         if not image_url:
             image_url = items[0].get("image_url")
 
-    # Build response text
-    lines = [
-        f"Task: {task_id}",
-        f"Type: {task_type}",
-        f"Status: {status}",
-        f"Estimated Cost: ${estimated_cost}",
-    ]
+    # Build response text: one template for the summary, one for the
+    # status-specific detail keyed by (status, kind)
+    if status == "completed":
+        kind = "audio" if audio_url else "video" if video_url else "image" if image_url else None
+    elif status == "failed":
+        kind = "error" if error_message else None
+    else:
+        kind = None
+
+    text = _TASK_SUMMARY_TEMPLATE.format(
+        task_id=task_id,
+        task_type=task_type,
+        status=status,
+        estimated_cost=estimated_cost,
+    )
 
     if actual_cost and actual_cost != "N/A":
-        lines.append(f"Actual Cost: ${actual_cost}")
+        text += f"\nActual Cost: ${actual_cost}"
 
-    if status == "completed":
-        if audio_url:
-            lines.append(f"\n🎵 Audio URL: {audio_url}")
-        elif video_url:
-            lines.append(f"\n🎬 Video URL: {video_url}")
-        elif image_url:
-            lines.append(f"\n🖼️ Image URL: {image_url}")
-    elif status == "failed" and error_message:
-        lines.append(f"\n❌ Error: {error_message}")
-    elif status in ("pending", "queued", "executing"):
-        lines.append(f"\n⏳ Task is still {status}. Check again shortly.")
+    detail = _TASK_DETAIL_TEMPLATES.get((status, kind))
+    if detail:
+        text += detail.format(
+            url=audio_url or video_url or image_url,
+            status=status,
+            error_message=error_message,
+        )
 
     return {
         "content": [{
             "type": "text",
-            "text": "\n".join(lines)
+            "text": text
         }]
     }
 
 
 def make_v3_get_request(endpoint: str) -> Dict[str, Any]:
-    """Make HTTP GET request to VAP V3 API (Directive #241)."""
-    url = f"{API_BASE_URL}{endpoint}"
-    headers = {
-        "Content-Type": "application/json",
-    }
-    if API_KEY:
-        headers["Authorization"] = f"Bearer {API_KEY}"
+    """Make HTTP GET request to VAP V3 API (Directive #241).
 
-    logger.debug(f"V3 GET Request: {url}")
+    endpoint is relative to API_BASE_URL.
+    """
+    logger.debug(f"V3 GET Request: {API_BASE_URL}{endpoint}")
 
     try:
-        if hasattr(httpx, 'Client'):
-            with httpx.Client(timeout=30.0) as client:
-                response = client.get(url, headers=headers)
-                response.raise_for_status()
-                return response.json()
-        else:
-            response = httpx.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            return response.json()
+        with _upstream_slots:
+            response = _v3_get(endpoint)
+        logger.debug("V3 GET Response: %s %s", response.status_code, getattr(response, "http_version", ""))
+        response.raise_for_status()
+        return response.json()
     except Exception as e:
         logger.error(f"V3 GET error: {e}")
         return {"error": str(e)}
@@ -425,6 +754,14 @@ def handle_resources_read(params: Dict) -> Dict:
     return response
 
 
+# Tools handled by the proxy itself (Directive #240); everything else is
+# forwarded to the MCP API
+LOCAL_TOOL_HANDLERS = {
+    "generate_video": _handle_generate_video,
+    "estimate_video_cost": _handle_estimate_video_cost,
+    "get_task": _handle_get_task,
+}
+
 # Method routing table
 METHOD_HANDLERS = {
     "initialize": handle_initialize,
@@ -497,7 +834,9 @@ def process_request(request: Dict) -> Optional[Dict]:
         if "error" in result and isinstance(result["error"], str):
             return create_error(request_id, -32000, result["error"])
 
-        return create_response(request_id, result)
+        # Success path runs on every call; build the envelope inline
+        # (same shape as create_response)
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
 
     except Exception as e:
         logger.error(f"Handler error: {e}", exc_info=True)
@@ -513,14 +852,14 @@ class MCPHTTPHandler(BaseHTTPRequestHandler):
 
     def log_message(self, format, *args):
         """Route HTTP server logs to our logger."""
-        logger.debug(f"HTTP: {format % args}")
+        logger.debug("HTTP: " + format, *args)
 
     def _send_json_response(self, data: Dict, status: int = 200):
         """Send JSON response with CORS headers."""
-        response_bytes = json.dumps(data).encode('utf-8')
+        response_bytes = _json_dumps(data)
         self.send_response(status)
         self.send_header('Content-Type', 'application/json')
-        self.send_header('Content-Length', len(response_bytes))
+        self.send_header('Content-Length', str(len(response_bytes)))
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
@@ -551,7 +890,8 @@ class MCPHTTPHandler(BaseHTTPRequestHandler):
         """Handle MCP JSON-RPC requests."""
         try:
             content_length = int(self.headers.get('Content-Length', 0))
-            body = self.rfile.read(content_length).decode('utf-8')
+            # Parsed straight from bytes; no intermediate str copy
+            body = self.rfile.read(content_length)
 
             if not body:
                 self._send_json_response(
@@ -560,9 +900,16 @@ class MCPHTTPHandler(BaseHTTPRequestHandler):
                 )
                 return
 
-            logger.debug(f"HTTP Request: {body[:500]}...")
+            logger.debug("HTTP Request: %.500s...", body)
+
+            request = _json_loads(body)
+            if not isinstance(request, dict):
+                self._send_json_response(
+                    create_error(None, -32600, "Invalid Request"),
+                    400
+                )
+                return
 
-            request = json.loads(body)
             response = process_request(request)
 
             if response is None:
@@ -586,9 +933,13 @@ class MCPHTTPHandler(BaseHTTPRequestHandler):
 
 
 def run_http_server(port: int):
-    """Run HTTP server for MCP requests."""
+    """Run HTTP server for MCP requests.
+
+    Each request is handled on its own thread, so one slow upstream call
+    doesn't stall other inspector requests (the pooled clients are thread-safe).
+    """
     server_address = ('', port)
-    httpd = HTTPServer(server_address, MCPHTTPHandler)
+    httpd = ThreadingHTTPServer(server_address, MCPHTTPHandler)
     logger.info(f"VAP MCP HTTP Server listening on port {port}")
     logger.info(f"Endpoints: POST / (JSON-RPC), GET /health")
     try:
@@ -602,34 +953,63 @@ def run_http_server(port: int):
 # STDIO MODE (for Claude Desktop)
 # ═══════════════════════════════════════════════════════════════════════════
 
+# Requests are dispatched to a worker pool so a slow upstream call (video
+# task creation can take tens of seconds) doesn't block reading the next
+# message. JSON-RPC responses carry their id, so clients match them up
+# regardless of order.
+_stdout_lock = threading.Lock()
+
+
+def _write_stdio(response: Dict):
+    """Write one JSON-RPC message to stdout."""
+    response_bytes = _json_dumps(response)
+    logger.debug("Sending: %.200s...", response_bytes)
+    with _stdout_lock:
+        sys.stdout.buffer.write(response_bytes + b"\n")
+        sys.stdout.buffer.flush()
+
+
+def _process_stdio_request(request: Dict):
+    """Process a request on a worker thread and write its response."""
+    request_id = request.get("id")
+    try:
+        response = process_request(request)
+    except Exception as e:
+        logger.error(f"Worker error: {e}", exc_info=True)
+        response = create_error(request_id, -32000, str(e))
+
+    # Send response only for requests (not notifications)
+    if response is not None:
+        _write_stdio(response)
+
+
 def run_stdio():
     """Run stdio loop for Claude Desktop."""
     logger.info("VAP MCP Proxy starting in stdio mode...")
 
-    # Read line by line from stdin
-    for line in sys.stdin:
-        line = line.strip()
-        if not line:
-            continue
+    with ThreadPoolExecutor(max_workers=STDIO_WORKERS, thread_name_prefix="vap-stdio") as executor:
+        # Read line by line from stdin (binary, no decode round trip)
+        for line in sys.stdin.buffer:
+            line = line.strip()
+            if not line:
+                continue
 
-        logger.debug(f"Received: {line[:200]}...")
+            logger.debug("Received: %.200s...", line)
 
-        try:
-            request = json.loads(line)
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON: {e}")
-            response = create_error(None, -32700, "Parse error")
-            print(json.dumps(response), flush=True)
-            continue
+            try:
+                request = _json_loads(line)
+            except json.JSONDecodeError as e:
+                logger.error(f"Invalid JSON: {e}")
+                _write_stdio(create_error(None, -32700, "Parse error"))
+                continue
 
-        # Process request
-        response = process_request(request)
+            # Batches, strings, numbers etc. aren't valid request objects
+            if not isinstance(request, dict):
+                logger.error(f"Invalid request: expected object, got {type(request).__name__}")
+                _write_stdio(create_error(None, -32600, "Invalid Request"))
+                continue
 
-        # Send response only for requests (not notifications)
-        if response is not None:
-            response_json = json.dumps(response)
-            logger.debug(f"Sending: {response_json[:200]}...")
-            print(response_json, flush=True)
+            executor.submit(_process_stdio_request, request)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -653,6 +1033,11 @@ def main():
         default=int(os.getenv('PORT', '8000')),
         help='HTTP server port (default: 8000 or PORT env var)'
     )
+    parser.add_argument(
+        '--dump-tools-list',
+        action='store_true',
+        help='Fetch tools/list upstream, write it to tools_list.json and exit'
+    )
 
     args = parser.parse_args()
 
@@ -662,6 +1047,9 @@ def main():
     if not API_KEY:
         logger.warning("VAP_API_KEY not set! Set it via environment variable (VAPE_API_KEY also supported).")
 
+    if args.dump_tools_list:
+        sys.exit(dump_tools_list())
+
     if args.mode == 'http':
         run_http_server(args.port)
     else:
@@ -4,7 +4,7 @@ VAP SDK - Basic Usage Example
 
 from vape_client import VAPClient, VAPAuthenticationError, VAPInsufficientBalanceError
 
-# Initialize client
+# Initialize client once and reuse it (keeps connections open between calls)
 client = VAPClient(api_key="your_api_key_here")
 
 # Generate an image
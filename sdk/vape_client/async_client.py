@@ -3,8 +3,9 @@ VAP Async Client
 Asynchronous HTTP client for VAP API
 """
 
+import asyncio
 import httpx
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 from .models import (
     GenerateResult,
     UpscaleResult,
@@ -25,7 +26,9 @@ from .exceptions import (
     VAPEServerError,
     VAPEConnectionError,
     VAPETimeoutError,
+    STATUS_ERRORS,
 )
+from .client import HTTP2_AVAILABLE, _json_loads, _retry_delay
 
 
 class AsyncVAPEClient:
@@ -78,60 +81,42 @@ class AsyncVAPEClient:
                 base_url=self.base_url,
                 timeout=self.timeout,
                 headers=self._default_headers(),
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                http2=HTTP2_AVAILABLE,
             )
         return self._client
 
     def _handle_response(self, response: httpx.Response) -> dict:
         """Handle API response and raise appropriate exceptions."""
+        status_code = response.status_code
         try:
-            data = response.json()
-        except:
+            data = _json_loads(response.content) if response.content else {}
+        except ValueError:
             data = {"error": response.text}
 
-        if response.status_code == 200:
+        if status_code == 200:
             return data
-        elif response.status_code == 401:
-            raise VAPEAuthenticationError(
-                message=data.get("error", "Authentication failed"),
-                status_code=401,
-                response=data,
-            )
-        elif response.status_code == 402:
-            raise VAPEInsufficientBalanceError(
-                message=data.get("error", "Insufficient balance"),
-                status_code=402,
-                response=data,
-                balance=data.get("balance"),
-                required=data.get("required"),
-            )
-        elif response.status_code == 429:
-            raise VAPERateLimitError(
-                message=data.get("error", "Rate limit exceeded"),
-                status_code=429,
-                response=data,
-                retry_after=data.get("retry_after"),
-                limit_type=data.get("limit_type"),
-            )
-        elif response.status_code == 400:
-            raise VAPEValidationError(
-                message=data.get("error", "Validation error"),
-                status_code=400,
-                response=data,
-                errors=data.get("errors"),
-            )
-        elif response.status_code >= 500:
-            raise VAPEServerError(
-                message=data.get("error", "Server error"),
-                status_code=response.status_code,
-                response=data,
-            )
+
+        if status_code in STATUS_ERRORS:
+            error_cls, default_message, fields = STATUS_ERRORS[status_code]
+        elif status_code >= 500:
+            error_cls, default_message, fields = VAPEServerError, "Server error", ()
         else:
-            raise VAPEError(
-                message=data.get("error", f"Request failed with status {response.status_code}"),
-                status_code=response.status_code,
-                response=data,
+            error_cls, default_message, fields = (
+                VAPEError, f"Request failed with status {status_code}", ()
             )
 
+        extra = {field: data.get(field) for field in fields}
+        if error_cls is VAPERateLimitError and extra["retry_after"] is None:
+            extra["retry_after"] = response.headers.get("Retry-After")
+
+        raise error_cls(
+            message=data.get("error", default_message),
+            status_code=status_code,
+            response=data,
+            **extra,
+        )
+
     async def _request(
         self,
         method: str,
@@ -168,11 +153,19 @@ class AsyncVAPEClient:
                 raise
 
             except VAPERateLimitError as e:
-                raise
+                last_error = e
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(_retry_delay(attempt, e.retry_after))
+                    continue
 
             except VAPEServerError as e:
+                # A 5xx on a POST may still have created (and billed) the
+                # task, so only GETs are retried
+                if method != "GET":
+                    raise
                 last_error = e
                 if attempt < self.max_retries - 1:
+                    await asyncio.sleep(_retry_delay(attempt))
                     continue
 
             except VAPEError:
@@ -270,6 +263,34 @@ class AsyncVAPEClient:
         data = await self._request("GET", "/v3/balance")
         return Balance.from_response(data)
 
+    async def generate_batch(
+        self,
+        items: List[Union[str, Dict[str, Any]]],
+        concurrency: int = 16,
+    ) -> List[Union[GenerateResult, Exception]]:
+        """
+        Generate several images concurrently over the shared connection pool.
+
+        Args:
+            items: Descriptions, or dicts of generate() keyword arguments
+            concurrency: Maximum number of requests in flight (default: 16)
+
+        Returns:
+            Results in the same order as items. A failed item yields its
+            exception instead of a GenerateResult.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(item: Union[str, Dict[str, Any]]) -> GenerateResult:
+            kwargs = {"description": item} if isinstance(item, str) else item
+            async with semaphore:
+                return await self.generate(**kwargs)
+
+        return await asyncio.gather(
+            *(_one(item) for item in items),
+            return_exceptions=True,
+        )
+
     # ============================================
     # Video Generation (Veo 3.1) - $1.96
     # ============================================
@@ -3,8 +3,10 @@ VAP Sync Client
 Synchronous HTTP client for VAP API
 """
 
+import time
+import threading
 import httpx
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from .models import (
     GenerateResult,
     UpscaleResult,
@@ -25,8 +27,37 @@ from .exceptions import (
     VAPEServerError,
     VAPEConnectionError,
     VAPETimeoutError,
+    STATUS_ERRORS,
 )
 
+# HTTP/2 multiplexes concurrent requests over one connection (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# orjson parses response bodies 2-5x faster when installed (pip install orjson)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Retry backoff: 0.2s, 0.4s, 0.8s, ... capped; a server Retry-After wins
+RETRY_BACKOFF_BASE = 0.2
+RETRY_BACKOFF_MAX = 10.0
+RETRY_AFTER_MAX = 60.0
+
+
+def _retry_delay(attempt: int, retry_after: Any = None) -> float:
+    """Seconds to wait before retry number attempt + 1."""
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), RETRY_AFTER_MAX)
+        except (TypeError, ValueError):
+            pass
+    return min(RETRY_BACKOFF_BASE * 2 ** attempt, RETRY_BACKOFF_MAX)
+
 
 class VAPEClient:
     """
@@ -36,17 +67,24 @@ class VAPEClient:
         client = VAPEClient(api_key="vape_xxx...")
         result = client.generate(description="A sunset")
         print(result.image_url)
+
+    Each client owns a connection pool; create one and reuse it (or use
+    VAPEClient.shared()) rather than constructing a client per request.
     """
 
     DEFAULT_BASE_URL = "https://api.vapagent.com"
     DEFAULT_TIMEOUT = 60.0
 
+    _shared: Dict[Tuple[str, str], "VAPEClient"] = {}
+    _shared_lock = threading.Lock()
+
     def __init__(
         self,
         api_key: str,
         base_url: str = None,
         timeout: float = None,
         max_retries: int = 3,
+        transport: Optional[httpx.BaseTransport] = None,
     ):
         """
         Initialize VAP client.
@@ -56,18 +94,48 @@ class VAPEClient:
             base_url: API base URL (default: http://localhost:8000)
             timeout: Request timeout in seconds (default: 60)
             max_retries: Max retry attempts for transient errors (default: 3)
+            transport: Optional httpx transport (e.g. to share a pool or for testing)
         """
         self.api_key = api_key
         self.base_url = (base_url or self.DEFAULT_BASE_URL).rstrip("/")
         self.timeout = timeout or self.DEFAULT_TIMEOUT
         self.max_retries = max_retries
+        self._is_shared = False
 
         self._client = httpx.Client(
             base_url=self.base_url,
             timeout=self.timeout,
             headers=self._default_headers(),
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=1000),
+            http2=HTTP2_AVAILABLE,
+            transport=transport,
         )
 
+    @classmethod
+    def shared(cls, api_key: str, base_url: str = None) -> "VAPEClient":
+        """
+        Get a process-wide client for this API key and base URL.
+
+        The instance is created on first use and reused afterwards, so its
+        connection pool stays warm across calls. close() (and leaving a
+        ``with`` block) is a no-op on it; the pool lives for the process.
+
+        Args:
+            api_key: Your VAP API key (starts with vape_)
+            base_url: API base URL (default: DEFAULT_BASE_URL)
+
+        Returns:
+            Shared VAPEClient instance
+        """
+        key = (api_key, (base_url or cls.DEFAULT_BASE_URL).rstrip("/"))
+        with cls._shared_lock:
+            client = cls._shared.get(key)
+            if client is None or client._client.is_closed:
+                client = cls(api_key, base_url=key[1])
+                client._is_shared = True
+                cls._shared[key] = client
+            return client
+
     def _default_headers(self) -> Dict[str, str]:
         """Get default request headers."""
         return {
@@ -78,55 +146,35 @@ class VAPEClient:
 
     def _handle_response(self, response: httpx.Response) -> dict:
         """Handle API response and raise appropriate exceptions."""
+        status_code = response.status_code
         try:
-            data = response.json()
-        except:
+            data = _json_loads(response.content) if response.content else {}
+        except ValueError:
             data = {"error": response.text}
 
-        if response.status_code == 200:
+        if status_code == 200:
             return data
-        elif response.status_code == 401:
-            raise VAPEAuthenticationError(
-                message=data.get("error", "Authentication failed"),
-                status_code=401,
-                response=data,
-            )
-        elif response.status_code == 402:
-            raise VAPEInsufficientBalanceError(
-                message=data.get("error", "Insufficient balance"),
-                status_code=402,
-                response=data,
-                balance=data.get("balance"),
-                required=data.get("required"),
-            )
-        elif response.status_code == 429:
-            raise VAPERateLimitError(
-                message=data.get("error", "Rate limit exceeded"),
-                status_code=429,
-                response=data,
-                retry_after=data.get("retry_after"),
-                limit_type=data.get("limit_type"),
-            )
-        elif response.status_code == 400:
-            raise VAPEValidationError(
-                message=data.get("error", "Validation error"),
-                status_code=400,
-                response=data,
-                errors=data.get("errors"),
-            )
-        elif response.status_code >= 500:
-            raise VAPEServerError(
-                message=data.get("error", "Server error"),
-                status_code=response.status_code,
-                response=data,
-            )
+
+        if status_code in STATUS_ERRORS:
+            error_cls, default_message, fields = STATUS_ERRORS[status_code]
+        elif status_code >= 500:
+            error_cls, default_message, fields = VAPEServerError, "Server error", ()
         else:
-            raise VAPEError(
-                message=data.get("error", f"Request failed with status {response.status_code}"),
-                status_code=response.status_code,
-                response=data,
+            error_cls, default_message, fields = (
+                VAPEError, f"Request failed with status {status_code}", ()
             )
 
+        extra = {field: data.get(field) for field in fields}
+        if error_cls is VAPERateLimitError and extra["retry_after"] is None:
+            extra["retry_after"] = response.headers.get("Retry-After")
+
+        raise error_cls(
+            message=data.get("error", default_message),
+            status_code=status_code,
+            response=data,
+            **extra,
+        )
+
     def _request(
         self,
         method: str,
@@ -164,12 +212,19 @@ class VAPEClient:
                 raise
 
             except VAPERateLimitError as e:
-                # Don't retry rate limit errors
-                raise
+                last_error = e
+                if attempt < self.max_retries - 1:
+                    time.sleep(_retry_delay(attempt, e.retry_after))
+                    continue
 
             except VAPEServerError as e:
+                # A 5xx on a POST may still have created (and billed) the
+                # task, so only GETs are retried
+                if method != "GET":
+                    raise
                 last_error = e
                 if attempt < self.max_retries - 1:
+                    time.sleep(_retry_delay(attempt))
                     continue
 
             except VAPEError:
@@ -178,7 +233,9 @@ class VAPEClient:
         raise last_error
 
     def close(self):
-        """Close the HTTP client."""
+        """Close the HTTP client (no-op for VAPEClient.shared() instances)."""
+        if self._is_shared:
+            return
         self._client.close()
 
     def __enter__(self):
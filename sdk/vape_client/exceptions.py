@@ -62,4 +62,13 @@ class VAPEConnectionError(VAPEError):
 
 class VAPETimeoutError(VAPEError):
     """Raised when request times out."""
-    pass
\ No newline at end of file
+    pass
+
+
+# Status code -> (exception class, default message, extra response fields)
+STATUS_ERRORS = {
+    400: (VAPEValidationError, "Validation error", ("errors",)),
+    401: (VAPEAuthenticationError, "Authentication failed", ()),
+    402: (VAPEInsufficientBalanceError, "Insufficient balance", ("balance", "required")),
+    429: (VAPERateLimitError, "Rate limit exceeded", ("retry_after", "limit_type")),
+}
\ No newline at end of file
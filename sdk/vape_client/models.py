@@ -3,12 +3,32 @@ VAP SDK Models
 Pydantic models for API responses
 """
 
-from typing import Optional, List, Dict, Any
+import sys
+from typing import Optional, List, Dict, Any, NamedTuple
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
 
 
-@dataclass
+def _model(**kwargs):
+    """
+    @dataclass for response models: immutable (frozen, so hashable when all
+    field values are) and with __slots__ (no per-instance __dict__) on 3.10+.
+
+    Use dataclasses.replace() to derive a modified copy.
+    """
+    kwargs.setdefault("frozen", True)
+    if sys.version_info >= (3, 10):
+        kwargs.setdefault("slots", True)
+    return dataclass(**kwargs)
+
+
+def _intern(value: Any) -> Any:
+    """Intern low-cardinality strings (status, currency) so instances share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@_model()
 class GenerateResult:
     """Result of image generation."""
     success: bool
@@ -23,19 +43,20 @@ class GenerateResult:
     @classmethod
     def from_response(cls, data: dict) -> "GenerateResult":
         """Create from API response."""
+        get = data.get
         return cls(
-            success=data.get("success", False),
-            image_url=data.get("image_url"),
-            image_base64=data.get("image_base64"),
-            request_id=data.get("request_id"),
-            aspect_ratio=data.get("aspect_ratio"),
-            cost=data.get("cost", 0.0),
-            metadata=data.get("metadata"),
-            error=data.get("error"),
+            success=get("success", False),
+            image_url=get("image_url"),
+            image_base64=get("image_base64"),
+            request_id=get("request_id"),
+            aspect_ratio=get("aspect_ratio"),
+            cost=get("cost", 0.0),
+            metadata=get("metadata"),
+            error=get("error"),
         )
 
 
-@dataclass
+@_model()
 class UpscaleResult:
     """Result of image upscaling."""
     success: bool
@@ -48,17 +69,18 @@ class UpscaleResult:
     @classmethod
     def from_response(cls, data: dict) -> "UpscaleResult":
         """Create from API response."""
+        get = data.get
         return cls(
-            success=data.get("success", False),
-            image_url=data.get("image_url"),
-            image_base64=data.get("image_base64"),
-            scale=data.get("scale"),
-            cost=data.get("cost", 0.0),
-            error=data.get("error"),
+            success=get("success", False),
+            image_url=get("image_url"),
+            image_base64=get("image_base64"),
+            scale=get("scale"),
+            cost=get("cost", 0.0),
+            error=get("error"),
         )
 
 
-@dataclass
+@_model()
 class ValidationCheck:
     """Individual validation check result."""
     name: str
@@ -66,7 +88,7 @@ class ValidationCheck:
     details: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@_model()
 class ValidateResult:
     """Result of image validation."""
     success: bool
@@ -82,23 +104,23 @@ class ValidateResult:
     @classmethod
     def from_response(cls, data: dict) -> "ValidateResult":
         """Create from API response."""
-        validation = data.get("validation", {})
+        get = data.get
+        validation = get("validation", {})
         return cls(
-            success=data.get("success", False),
+            success=get("success", False),
             valid=validation.get("valid", False),
             issues=validation.get("issues"),
             warnings=validation.get("warnings"),
             format_info=validation.get("format"),
             dimensions=validation.get("dimensions"),
             size_info=validation.get("size"),
-            cost=data.get("cost", 0.0),
-            error=data.get("error"),
+            cost=get("cost", 0.0),
+            error=get("error"),
         )
 
 
-@dataclass
-class HealthStatus:
-    """API health status."""
+class HealthStatus(NamedTuple):
+    """API health status (immutable tuple)."""
     status: str
     version: Optional[str] = None
     service: Optional[str] = None
@@ -107,17 +129,17 @@ class HealthStatus:
     @classmethod
     def from_response(cls, data: dict) -> "HealthStatus":
         """Create from API response."""
+        get = data.get
         return cls(
-            status=data.get("status", "unknown"),
-            version=data.get("version"),
-            service=data.get("service"),
-            dependencies=data.get("dependencies"),
+            status=_intern(get("status", "unknown")),
+            version=get("version"),
+            service=get("service"),
+            dependencies=get("dependencies"),
         )
 
 
-@dataclass
-class Balance:
-    """Client balance information."""
+class Balance(NamedTuple):
+    """Client balance information (immutable tuple)."""
     balance: float
     currency: str = "USD"
     reserved: float = 0.0
@@ -126,15 +148,32 @@ class Balance:
     @classmethod
     def from_response(cls, data: dict) -> "Balance":
         """Create from API response."""
-        return cls(
-            balance=float(data.get("balance", 0)),
-            currency=data.get("currency", "USD"),
-            reserved=float(data.get("reserved", 0)),
-            usable=float(data.get("usable", data.get("balance", 0))),
+        get = data.get
+        balance = get("balance", 0.0)
+        reserved = get("reserved", 0.0)
+        usable = get("usable", balance)
+        # JSON numbers with a fraction already arrive as float; skip float() for those
+        fields = (
+            balance if type(balance) is float else float(balance),
+            _intern(get("currency", "USD")),
+            reserved if type(reserved) is float else float(reserved),
+            usable if type(usable) is float else float(usable),
         )
+        if cls is not Balance:
+            return cls(*fields)
+        return _cached_balance(*fields)
+
+
+@lru_cache(maxsize=256)
+def _cached_balance(balance: float, currency: str, reserved: float, usable: float) -> Balance:
+    """
+    Balance instances are immutable, so polling loops that see the same
+    figures get the same object back instead of a new allocation.
+    """
+    return Balance(balance, currency, reserved, usable)
 
 
-@dataclass
+@_model()
 class VideoResult:
     """Result of video generation."""
     success: bool
@@ -151,21 +190,22 @@ class VideoResult:
     @classmethod
     def from_response(cls, data: dict) -> "VideoResult":
         """Create from API response."""
+        get = data.get
         return cls(
-            success=data.get("success", False),
-            task_id=data.get("task_id"),
-            video_url=data.get("video_url") or data.get("result_url"),
-            duration=data.get("duration"),
-            resolution=data.get("resolution"),
-            aspect_ratio=data.get("aspect_ratio"),
-            has_audio=data.get("has_audio", False),
-            cost=data.get("cost", 0.0),
-            status=data.get("status"),
-            error=data.get("error"),
+            success=get("success", False),
+            task_id=get("task_id"),
+            video_url=get("video_url") or get("result_url"),
+            duration=get("duration"),
+            resolution=get("resolution"),
+            aspect_ratio=get("aspect_ratio"),
+            has_audio=get("has_audio", False),
+            cost=get("cost", 0.0),
+            status=get("status"),
+            error=get("error"),
         )
 
 
-@dataclass
+@_model()
 class MusicResult:
     """Result of music generation."""
     success: bool
@@ -181,20 +221,21 @@ class MusicResult:
     @classmethod
     def from_response(cls, data: dict) -> "MusicResult":
         """Create from API response."""
+        get = data.get
         return cls(
-            success=data.get("success", False),
-            task_id=data.get("task_id"),
-            audio_url=data.get("audio_url") or data.get("result_url"),
-            duration=data.get("duration"),
-            audio_format=data.get("audio_format", "mp3"),
-            instrumental=data.get("instrumental", False),
-            cost=data.get("cost", 0.0),
-            status=data.get("status"),
-            error=data.get("error"),
+            success=get("success", False),
+            task_id=get("task_id"),
+            audio_url=get("audio_url") or get("result_url"),
+            duration=get("duration"),
+            audio_format=get("audio_format", "mp3"),
+            instrumental=get("instrumental", False),
+            cost=get("cost", 0.0),
+            status=get("status"),
+            error=get("error"),
         )
 
 
-@dataclass
+@_model()
 class TaskResult:
     """Result of task status query."""
     task_id: str
@@ -210,20 +251,21 @@ class TaskResult:
     @classmethod
     def from_response(cls, data: dict) -> "TaskResult":
         """Create from API response."""
+        get = data.get
         return cls(
-            task_id=data.get("task_id", ""),
-            status=data.get("status", "unknown"),
-            task_type=data.get("task_type") or data.get("type"),
-            result_url=data.get("result_url") or data.get("image_url") or data.get("video_url") or data.get("audio_url"),
-            cost=data.get("cost", 0.0),
-            created_at=data.get("created_at"),
-            completed_at=data.get("completed_at"),
-            error=data.get("error"),
-            metadata=data.get("metadata"),
+            task_id=get("task_id", ""),
+            status=get("status", "unknown"),
+            task_type=get("task_type") or get("type"),
+            result_url=get("result_url") or get("image_url") or get("video_url") or get("audio_url"),
+            cost=get("cost", 0.0),
+            created_at=get("created_at"),
+            completed_at=get("completed_at"),
+            error=get("error"),
+            metadata=get("metadata"),
         )
 
 
-@dataclass
+@_model()
 class TaskListResult:
     """Result of task list query."""
     tasks: List["TaskResult"]
@@ -234,11 +276,12 @@ class TaskListResult:
     @classmethod
     def from_response(cls, data: dict) -> "TaskListResult":
         """Create from API response."""
-        tasks_data = data.get("tasks", [])
+        get = data.get
+        tasks_data = get("tasks", [])
         tasks = [TaskResult.from_response(t) for t in tasks_data]
         return cls(
             tasks=tasks,
-            total=data.get("total", len(tasks)),
-            limit=data.get("limit", 10),
-            offset=data.get("offset", 0),
+            total=get("total", len(tasks)),
+            limit=get("limit", 10),
+            offset=get("offset", 0),
         )
\ No newline at end of file